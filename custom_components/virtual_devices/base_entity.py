@@ -2,17 +2,23 @@
 
 This module provides a unified base class with generic type parameters
 for configuration and state, implementing common functionality like
-state persistence, attribute initialization, and template support.
+state persistence, attribute initialization, and template support. It
+also provides the per-entry storage and update tick shared by platforms
+that simulate their entities on a schedule.
 """
 from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from typing import Any, Generic, Protocol, TypeVar, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.storage import Store
 
 from .const import CONF_ENTITY_NAME, DOMAIN
@@ -28,6 +34,213 @@ TConfig = TypeVar("TConfig", bound=EntityConfigBase)
 TState = TypeVar("TState", bound=EntityState)
 
 
+class EntryStorage(Generic[TState]):
+    """Shared state storage for all entities of one platform in a config entry.
+
+    Every entity's state is kept in a single file keyed by entity index, so
+    setup needs one load and bursts of changes collapse into one debounced
+    write. Only entities that were added to Home Assistant are registered;
+    the stored state of any other index (e.g. a disabled entity) is written
+    back unchanged.
+
+    Type Parameters:
+        TState: The TypedDict type for entity state
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key_prefix: str,
+        config_entry_id: str,
+        save_delay: float,
+        pack: Callable[[TState], dict[str, Any]] | None = None,
+        unpack: Callable[[dict[str, Any]], TState] | None = None,
+    ) -> None:
+        """Initialize the storage for a config entry.
+
+        Args:
+            hass: Home Assistant instance
+            key_prefix: Storage key prefix (e.g., "virtual_devices_weather")
+            config_entry_id: The config entry ID for this device
+            save_delay: Seconds to wait before writing scheduled changes
+            pack: Converts a state to its stored form (default: as is)
+            unpack: Converts a stored form back to a state (default: as is)
+        """
+        self._hass = hass
+        self._key_prefix = key_prefix
+        self._config_entry_id = config_entry_id
+        self._save_delay = save_delay
+        self._pack = pack or cast(Callable[[TState], dict[str, Any]], dict)
+        self._unpack = unpack or cast(Callable[[dict[str, Any]], TState], dict)
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, f"{key_prefix}_{config_entry_id}"
+        )
+        self._data: dict[str, dict[str, Any]] = {}
+        self._entities: dict[int, Callable[[], TState]] = {}
+        self._dirty = False
+
+    async def async_load(self, entity_count: int) -> None:
+        """Load the stored state of every entity.
+
+        Args:
+            entity_count: Number of entities, used to find files written
+                by earlier versions that stored one file per entity
+        """
+        try:
+            data = await self._store.async_load()
+        except Exception as ex:
+            _LOGGER.error("Error loading state from %s: %s", self._store.key, ex)
+            return
+        if data is None:
+            await self._async_import_legacy(entity_count)
+        else:
+            self._data = data
+
+    async def _async_import_legacy(self, entity_count: int) -> None:
+        """Move state saved by earlier versions, one file per entity, into this store.
+
+        Each legacy file is read and removed on its own, so an unreadable file
+        only costs that entity its state. Files are removed only once the
+        combined file holding their state is on disk.
+        """
+        data: dict[str, dict[str, Any]] = {}
+        legacy_stores: list[Store[TState]] = []
+        for index in range(entity_count):
+            legacy: Store[TState] = Store(
+                self._hass,
+                STORAGE_VERSION,
+                f"{self._key_prefix}_{self._config_entry_id}_{index}",
+            )
+            try:
+                state = await legacy.async_load()
+                if state:
+                    data[str(index)] = self._pack(state)
+                    legacy_stores.append(legacy)
+            except Exception as ex:
+                _LOGGER.error("Error loading state from %s: %s", legacy.key, ex)
+
+        if not data:
+            return
+        self._data = data
+        try:
+            await self._store.async_save(data)
+        except Exception as ex:
+            # Keep the old files; the imported state goes out with the next save
+            _LOGGER.error("Error saving state to %s: %s", self._store.key, ex)
+            return
+        for legacy in legacy_stores:
+            try:
+                await legacy.async_remove()
+            except Exception as ex:
+                _LOGGER.error("Error removing %s: %s", legacy.key, ex)
+
+    def get(self, index: int) -> TState | None:
+        """Return the stored state of the entity at index, if any."""
+        data = self._data.get(str(index))
+        return self._unpack(data) if data else None
+
+    def register(self, index: int, get_state: Callable[[], TState]) -> None:
+        """Collect the state of the entity at index on every write.
+
+        Args:
+            index: Index of the entity within the device
+            get_state: Returns the entity's current state
+        """
+        self._entities[index] = get_state
+
+    async def async_unregister(self, index: int) -> None:
+        """Write pending changes, then stop collecting the entity at index."""
+        try:
+            await self.async_flush()
+        except Exception as ex:
+            _LOGGER.error("Error saving state to %s: %s", self._store.key, ex)
+        self._entities.pop(index, None)
+
+    @callback
+    def async_schedule_save(self, index: int, state: TState) -> bool:
+        """Schedule a debounced write if the state of the entity at index changed.
+
+        The Store flushes a pending write when Home Assistant stops.
+
+        Returns:
+            True if a write was scheduled
+        """
+        data = self._pack(state)
+        key = str(index)
+        if self._data.get(key) == data:
+            return False
+        self._data[key] = data
+        self._dirty = True
+        self._store.async_delay_save(self._collect, self._save_delay)
+        return True
+
+    async def async_flush(self) -> None:
+        """Write any pending changes immediately."""
+        if self._dirty:
+            await self._store.async_save(self._collect())
+
+    def _collect(self) -> dict[str, dict[str, Any]]:
+        """Return the stored state with every registered entity's current state."""
+        self._dirty = False
+        for index, get_state in self._entities.items():
+            self._data[str(index)] = self._pack(get_state())
+        return self._data
+
+
+class SimulatedEntity(Protocol):
+    """Entity advanced by a per-entry tick."""
+
+    hass: HomeAssistant | None
+    entity_id: str
+
+    def snapshot(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity's written state."""
+
+    async def async_advance(self, now: Any) -> None:
+        """Advance the simulation to now."""
+
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine."""
+
+
+def async_track_entry_updates(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    entities: Sequence[SimulatedEntity],
+    interval: timedelta,
+    clock: Callable[[], Any],
+) -> None:
+    """Advance the entities of a config entry together on a fixed interval.
+
+    Each tick reads clock() once and passes it to every added entity, then
+    writes the state of those whose snapshot changed. An entity that raises
+    is logged and skipped, so it cannot stall the others. The timer is
+    released when the config entry unloads.
+
+    Args:
+        hass: Home Assistant instance
+        config_entry: The config entry that owns the entities
+        entities: Entities to advance; ones not yet added are skipped
+        interval: Time between ticks
+        clock: Returns the time handed to async_advance
+    """
+
+    async def _async_tick(_now: datetime) -> None:
+        now = clock()
+        for entity in entities:
+            if entity.hass is None:
+                continue
+            try:
+                previous = entity.snapshot()
+                await entity.async_advance(now)
+                if entity.snapshot() != previous:
+                    entity.async_write_ha_state()
+            except Exception:
+                _LOGGER.exception("Error updating %s", entity.entity_id)
+
+    config_entry.async_on_unload(async_track_time_interval(hass, _async_tick, interval))
+
+
 class BaseVirtualEntity(Entity, ABC, Generic[TConfig, TState]):
     """Base class for all virtual device entities.
 
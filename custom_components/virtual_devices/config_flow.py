@@ -277,7 +277,7 @@ class VirtualDevicesMultiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ],
             "weather": [
                 "weather_station_type", "temperature_unit", "wind_speed_unit",
-                "pressure_unit", "visibility_unit"
+                "pressure_unit", "visibility_unit", "random_seed"
             ],
             DEVICE_TYPE_WASHER: [
                 CONF_LAUNDRY_MODE, CONF_CYCLE_DURATION_MINUTES, CONF_SUPPORTS_PAUSE,
@@ -562,6 +562,9 @@ class SchemaFactory:
             vol.Optional("visibility_unit", default="km"): vol.In(
                 ["km", "miles"]
             ),
+            vol.Optional("random_seed"): vol.All(
+                vol.Coerce(int), vol.Range(min=0)
+            ),
         }
 
 
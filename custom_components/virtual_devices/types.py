@@ -377,6 +377,7 @@ class AirPurifierState(EntityState):
 class WeatherEntityConfig(EntityConfigBase):
     """Configuration for weather entities."""
     weather_station_type: NotRequired[str]
+    random_seed: NotRequired[int]
 
 
 class WeatherState(EntityState):
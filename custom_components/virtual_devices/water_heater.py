@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import logging
 import random
+import sys
 import time
-from typing import Any
+from datetime import timedelta
+from typing import Any, cast
 
 from homeassistant.components.water_heater import (
     WaterHeaterEntity,
@@ -15,9 +17,8 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.storage import Store
 
-from .base_entity import STORAGE_VERSION
+from .base_entity import EntryStorage, async_track_entry_updates
 from .const import (
     CONF_ENTITIES,
     CONF_ENTITY_NAME,
@@ -29,6 +30,69 @@ from .types import WaterHeaterEntityConfig, WaterHeaterState
 
 _LOGGER = logging.getLogger(__name__)
 
+# Per heater type: icon, allowed temperature range (°C), heating and standby
+# power range (W) and heating rate (°C per minute)
+_ICON_MAP: dict[str, str] = {
+    "electric": "mdi:water-boiler",
+    "gas": "mdi:fire",
+    "solar": "mdi:solar-power",
+    "heat_pump": "mdi:heat-pump",
+    "tankless": "mdi:water-boiler-outline",
+}
+_TEMP_RANGES: dict[str, tuple[int, int]] = {
+    "electric": (40, 75),
+    "gas": (35, 80),
+    "solar": (45, 70),
+    "heat_pump": (35, 65),
+    "tankless": (35, 60),
+}
+_POWER_MAP: dict[str, tuple[int, int]] = {
+    "electric": (2000, 3000),
+    "gas": (3000, 5000),
+    "solar": (1000, 2000),
+    "heat_pump": (800, 1500),
+    "tankless": (5000, 8000),
+}
+_STANDBY_MAP: dict[str, tuple[int, int]] = {
+    "electric": (5, 15),
+    "gas": (10, 30),
+    "solar": (2, 5),
+    "heat_pump": (5, 20),
+    "tankless": (5, 10),
+}
+_HEATING_RATE_MAP: dict[str, float] = {
+    "electric": 0.5,
+    "gas": 1.2,
+    "solar": 0.3,
+    "heat_pump": 0.4,
+    "tankless": 2.0,
+}
+
+# Operation modes offered by every virtual water heater
+OPERATION_MODE_OFF = "off"
+OPERATION_MODE_HEAT = "heat"
+OPERATION_MODE_ECO = "eco"
+
+# Bus event fired for template consumers
+TEMPLATE_UPDATE_EVENT = f"{DOMAIN}_water_heater_template_update"
+
+# Seconds to wait before writing state changes to storage
+SAVE_DELAY = 15
+
+# Short keys each heater's state is stored under, with the WaterHeaterState
+# names they stand for
+_PACKED_KEYS: tuple[tuple[str, str], ...] = (
+    ("op", "current_operation"),
+    ("tt", "target_temperature"),
+    ("ct", "current_temperature"),
+)
+
+# Interval of the shared tick that advances every heater of a config entry
+UPDATE_INTERVAL = timedelta(seconds=60)
+
+# How often (seconds) a solar heater re-rolls its "boost available" flag
+SOLAR_BOOST_REFRESH_INTERVAL = 600
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,32 +105,97 @@ async def async_setup_entry(
     if device_type != DEVICE_TYPE_WATER_HEATER:
         return
 
-    device_info: DeviceInfo = hass.data[DOMAIN][config_entry.entry_id]["device_info"]
-    entities: list[VirtualWaterHeater] = []
+    entry_id = config_entry.entry_id
+    device_info: DeviceInfo = hass.data[DOMAIN][entry_id]["device_info"]
     entities_config: list[WaterHeaterEntityConfig] = config_entry.data.get(CONF_ENTITIES, [])
 
-    for idx, entity_config in enumerate(entities_config):
-        entity = VirtualWaterHeater(
-            hass,
-            config_entry.entry_id,
-            entity_config,
-            idx,
-            device_info,
-        )
-        entities.append(entity)
-
+    # One storage file and one load for all heaters of this entry
+    storage: EntryStorage[WaterHeaterState] = EntryStorage(
+        hass, "virtual_devices_water_heater", entry_id, SAVE_DELAY, _pack_state, _unpack_state
+    )
+    await storage.async_load(len(entities_config))
+
+    # Kept as a list (not a generator) because the shared tick iterates it
+    entities: list[VirtualWaterHeater] = [
+        VirtualWaterHeater(hass, entry_id, entity_config, idx, device_info, storage)
+        for idx, entity_config in enumerate(entities_config)
+    ]
     async_add_entities(entities)
 
+    # Heaters integrate over elapsed monotonic seconds
+    async_track_entry_updates(hass, config_entry, entities, UPDATE_INTERVAL, time.monotonic)
+
+
+def _pack_state(state: WaterHeaterState) -> dict[str, Any]:
+    """Return state in the compact on-disk form."""
+    data = cast(dict[str, Any], state)
+    return {short: data[long] for short, long in _PACKED_KEYS}
+
+
+def _unpack_state(data: dict[str, Any]) -> WaterHeaterState:
+    """Return state from the compact on-disk form."""
+    return cast(
+        WaterHeaterState,
+        {long: data[short] for short, long in _PACKED_KEYS if short in data},
+    )
+
 
 class VirtualWaterHeater(WaterHeaterEntity):
     """Representation of a virtual water heater.
 
-    This entity implements state persistence using the same pattern as BaseVirtualEntity.
+    State is persisted through the EntryStorage shared by its config entry.
     """
 
-    _attr_should_poll: bool = True
+    # Slots for the fields owned by this class; the HA base classes keep a
+    # __dict__ for the _attr_* values they read.
+    __slots__ = (
+        "_hass",
+        "_config_entry_id",
+        "_entity_config",
+        "_index",
+        "_templates",
+        "_templates_enabled",
+        "_storage",
+        "_heater_type",
+        "_is_solar",
+        "_is_gas",
+        "_heating_rate",
+        "_nominal_power",
+        "_nominal_standby",
+        "_energy_consumed_today",
+        "_power_consumption",
+        "_total_energy_consumed",
+        "_tank_capacity",
+        "_efficiency",
+        "_const_attrs",
+        "_is_heating",
+        "_heating_start_time",
+        "_last_update",
+        "_solar_boost_available",
+        "_solar_boost_checked",
+        "_last_template_payload",
+        "_event_base",
+        "_attrs_cache_key",
+        "_attrs_cache",
+    )
+
+    # Updates are driven by the per-entry tick in async_setup_entry
+    _attr_should_poll: bool = False
     _attr_entity_registry_enabled_default: bool = True
 
+    # Identical for every virtual water heater
+    _attr_supported_features: WaterHeaterEntityFeature = (
+        WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        | WaterHeaterEntityFeature.OPERATION_MODE
+        | WaterHeaterEntityFeature.AWAY_MODE
+    )
+    _attr_operation_list: list[str] = [
+        OPERATION_MODE_OFF,
+        OPERATION_MODE_HEAT,
+        OPERATION_MODE_ECO,
+    ]
+    _attr_temperature_unit: str = UnitOfTemperature.CELSIUS
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -74,6 +203,7 @@ class VirtualWaterHeater(WaterHeaterEntity):
         entity_config: WaterHeaterEntityConfig,
         index: int,
         device_info: DeviceInfo,
+        storage: EntryStorage[WaterHeaterState],
     ) -> None:
         """Initialize the virtual water heater."""
         self._hass = hass
@@ -85,39 +215,28 @@ class VirtualWaterHeater(WaterHeaterEntity):
         self._attr_name = entity_name
         self._attr_unique_id = f"{config_entry_id}_water_heater_{index}"
         self._attr_device_info = device_info
-        self._attr_icon = "mdi:water-boiler"
 
         # Template support
         self._templates: dict[str, Any] = entity_config.get("templates", {})
+        self._templates_enabled: bool = bool(self._templates)
 
-        # Storage for state persistence
-        self._store: Store[WaterHeaterState] = Store(
-            hass, STORAGE_VERSION, f"virtual_devices_water_heater_{config_entry_id}_{index}"
-        )
-
-        # Supported features
-        self._attr_supported_features: WaterHeaterEntityFeature = (
-            WaterHeaterEntityFeature.TARGET_TEMPERATURE
-            | WaterHeaterEntityFeature.OPERATION_MODE
-            | WaterHeaterEntityFeature.AWAY_MODE
-        )
+        # State persistence shared with the other heaters of this entry;
+        # the heater registers once added, so a disabled heater never
+        # overwrites its stored state with config defaults
+        self._storage = storage
 
         # Heater type
         heater_type: str = entity_config.get("heater_type", "electric")
         self._heater_type = heater_type
+        self._is_solar: bool = heater_type == "solar"
+        self._is_gas: bool = heater_type == "gas"
+        self._heating_rate: float = _HEATING_RATE_MAP.get(heater_type, 0.5)
 
         # Set icon based on type
-        icon_map: dict[str, str] = {
-            "electric": "mdi:water-boiler",
-            "gas": "mdi:fire",
-            "solar": "mdi:solar-power",
-            "heat_pump": "mdi:heat-pump",
-            "tankless": "mdi:water-boiler-outline",
-        }
-        self._attr_icon = icon_map.get(heater_type, "mdi:water-boiler")
+        self._attr_icon = _ICON_MAP.get(heater_type, "mdi:water-boiler")
 
         # Initial state
-        self._attr_current_operation: str | None = "off"
+        self._attr_current_operation: str | None = OPERATION_MODE_OFF
         self._attr_is_away_mode_on: bool = False
 
         # Temperature settings
@@ -125,57 +244,78 @@ class VirtualWaterHeater(WaterHeaterEntity):
         self._attr_target_temperature: float = entity_config.get("target_temperature", 60)
 
         # Set temperature range based on heater type
-        temp_ranges: dict[str, tuple[int, int]] = {
-            "electric": (40, 75),
-            "gas": (35, 80),
-            "solar": (45, 70),
-            "heat_pump": (35, 65),
-            "tankless": (35, 60),
-        }
-        min_temp, max_temp = temp_ranges.get(heater_type, (40, 75))
+        min_temp, max_temp = _TEMP_RANGES.get(heater_type, (40, 75))
         self._attr_min_temp: float = min_temp
         self._attr_max_temp: float = max_temp
-        self._attr_temperature_unit = UnitOfTemperature.CELSIUS
 
-        # Operation modes
-        self._attr_operation_list: list[str] = ["off", "heat", "eco"]
+        # Nominal power draw (whole watts) while heating and on standby, the
+        # midpoint of the type's range
+        min_power, max_power = _POWER_MAP.get(heater_type, (2000, 3000))
+        self._nominal_power: int = (min_power + max_power) // 2
+        min_power, max_power = _STANDBY_MAP.get(heater_type, (5, 15))
+        self._nominal_standby: int = (min_power + max_power) // 2
 
         # Energy consumption
         self._energy_consumed_today: float = entity_config.get("energy_consumed_today", 5.0)
-        self._power_consumption: float = 0
+        self._power_consumption: int = 0
         self._total_energy_consumed: float = entity_config.get("total_energy_consumed", 1000.0)
 
         # Capacity and efficiency
         self._tank_capacity: int = entity_config.get("tank_capacity", 80)
         self._efficiency: float = entity_config.get("efficiency", 0.9)
 
+        # Attributes that never change after setup, formatted once
+        self._const_attrs: dict[str, Any] = {
+            "heater_type": WATER_HEATER_TYPES.get(heater_type, heater_type),
+            "tank_capacity": f"{self._tank_capacity}L",
+            "efficiency": f"{self._efficiency * 100:.0f}%",
+        }
+
         # Heating state
         self._is_heating: bool = False
         self._heating_start_time: float | None = None
         self._last_update: float | None = None
 
-        _LOGGER.info(f"Virtual water heater '{self._attr_name}' initialized")
+        # Solar boost availability is sampled periodically, not on every read
+        self._solar_boost_available: bool = bool(random.getrandbits(1))
+        self._solar_boost_checked: float = time.monotonic()
+
+        # Last values reported through the periodic template event
+        self._last_template_payload: tuple[Any, ...] | None = None
+
+        # Fields shared by every template event; entity_id is filled in once
+        # the entity has been registered
+        self._event_base: dict[str, Any] = {"entity_id": None, "device_id": config_entry_id}
+
+        # Formatted extra_state_attributes and the values they were built from
+        self._attrs_cache_key: tuple[Any, ...] | None = None
+        self._attrs_cache: dict[str, Any] | None = None
+
+        _LOGGER.info("Virtual water heater '%s' initialized", self._attr_name)
 
     def get_default_state(self) -> WaterHeaterState:
         """Return the default state for this entity type."""
         return {
-            "current_operation": "off",
+            "current_operation": OPERATION_MODE_OFF,
             "target_temperature": 60.0,
             "current_temperature": 25.0,
         }
 
     def apply_state(self, state: WaterHeaterState) -> None:
         """Apply loaded state to entity attributes."""
-        self._attr_current_operation = state.get("current_operation", "off")
+        # Interned so the per-tick mode checks hit the identity fast path
+        self._attr_current_operation = sys.intern(
+            state.get("current_operation", OPERATION_MODE_OFF)
+        )
         self._attr_target_temperature = state.get("target_temperature", 60.0)
         self._attr_current_temperature = state.get("current_temperature", 25.0)
 
     def get_current_state(self) -> WaterHeaterState:
         """Get current state for persistence."""
         return {
-            "current_operation": self._attr_current_operation or "off",
-            "target_temperature": self._attr_target_temperature,
-            "current_temperature": self._attr_current_temperature,
+            "current_operation": self._attr_current_operation or OPERATION_MODE_OFF,
+            "target_temperature": float(self._attr_target_temperature),
+            "current_temperature": round(float(self._attr_current_temperature), 1),
         }
 
     @property
@@ -184,90 +324,101 @@ class VirtualWaterHeater(WaterHeaterEntity):
         return True
 
     async def async_load_state(self) -> None:
-        """Load saved state from storage."""
-        try:
-            data = await self._store.async_load()
-            if data:
-                self.apply_state(data)
-                _LOGGER.debug(f"Water heater '{self._attr_name}' state loaded")
-        except Exception as ex:
-            _LOGGER.error(f"Failed to load state for water heater '{self._attr_name}': {ex}")
-            self.apply_state(self.get_default_state())
+        """Apply the state loaded for this heater by the entry storage."""
+        data = self._storage.get(self._index)
+        if data:
+            self.apply_state(data)
+            _LOGGER.debug("Water heater '%s' state loaded", self._attr_name)
 
     async def async_save_state(self) -> None:
-        """Save current state to storage."""
-        try:
-            data = self.get_current_state()
-            await self._store.async_save(data)
-            _LOGGER.debug(f"Water heater '{self._attr_name}' state saved")
-        except Exception as ex:
-            _LOGGER.error(f"Failed to save state for water heater '{self._attr_name}': {ex}")
+        """Schedule a debounced save of the current state to storage."""
+        if self._storage.async_schedule_save(self._index, self.get_current_state()):
+            _LOGGER.debug("Water heater '%s' state save scheduled", self._attr_name)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added to hass."""
         await super().async_added_to_hass()
+        self._event_base = {"entity_id": self.entity_id, "device_id": self._config_entry_id}
         await self.async_load_state()
+        self._storage.register(self._index, self.get_current_state)
         self.async_write_ha_state()
-        _LOGGER.info(f"Virtual water heater '{self._attr_name}' added to Home Assistant")
+        _LOGGER.info("Virtual water heater '%s' added to Home Assistant", self._attr_name)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Flush the pending save so a reloaded entity loads the latest state."""
+        await super().async_will_remove_from_hass()
+        await self._storage.async_unregister(self._index)
 
     def fire_template_event(self, action: str, **kwargs: Any) -> None:
         """Fire a template update event if templates are configured."""
-        if self._templates:
+        if self._templates_enabled:
             self._hass.bus.async_fire(
-                f"{DOMAIN}_water_heater_template_update",
-                {
-                    "entity_id": self.entity_id,
-                    "device_id": self._config_entry_id,
-                    "action": action,
-                    **kwargs,
-                },
+                TEMPLATE_UPDATE_EVENT,
+                {**self._event_base, "action": action, **kwargs},
             )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get("temperature")
-        if temperature is None:
+        if temperature is None or temperature == self._attr_target_temperature:
             return
 
         if self._attr_min_temp <= temperature <= self._attr_max_temp:
             self._attr_target_temperature = temperature
             await self.async_save_state()
             self.async_write_ha_state()
-            _LOGGER.debug(f"Water heater '{self._attr_name}' target temperature set to {temperature}°C")
+            _LOGGER.debug(
+                "Water heater '%s' target temperature set to %s°C", self._attr_name, temperature
+            )
             self.fire_template_event("water_heater.set_temperature", temperature=temperature)
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new operation mode."""
-        self._attr_current_operation = operation_mode
-        self._update_heating_state()
+        if operation_mode == self._attr_current_operation:
+            return
+
+        self._attr_current_operation = sys.intern(operation_mode)
+        if self._update_heating_state(time.monotonic()):
+            self._update_power_consumption()
         await self.async_save_state()
         self.async_write_ha_state()
-        _LOGGER.debug(f"Water heater '{self._attr_name}' operation mode set to {operation_mode}")
+        _LOGGER.debug(
+            "Water heater '%s' operation mode set to %s", self._attr_name, operation_mode
+        )
         self.fire_template_event("water_heater.set_operation_mode", operation_mode=operation_mode)
 
     async def async_turn_away_mode_on(self) -> None:
         """Turn away mode on."""
+        if self._attr_is_away_mode_on:
+            return
+
         self._attr_is_away_mode_on = True
         self.async_write_ha_state()
-        _LOGGER.debug(f"Water heater '{self._attr_name}' away mode turned on")
+        _LOGGER.debug("Water heater '%s' away mode turned on", self._attr_name)
         self.fire_template_event("water_heater.turn_away_mode_on")
 
     async def async_turn_away_mode_off(self) -> None:
         """Turn away mode off."""
+        if not self._attr_is_away_mode_on:
+            return
+
         self._attr_is_away_mode_on = False
         self.async_write_ha_state()
-        _LOGGER.debug(f"Water heater '{self._attr_name}' away mode turned off")
+        _LOGGER.debug("Water heater '%s' away mode turned off", self._attr_name)
         self.fire_template_event("water_heater.turn_away_mode_off")
 
-    def _update_heating_state(self) -> None:
-        """Update heating state based on operation mode."""
+    def _update_heating_state(self, now: float) -> bool:
+        """Update heating state based on operation mode.
+
+        Returns True if the heater started or stopped heating.
+        """
         was_heating = self._is_heating
 
-        if self._attr_current_operation == "heat":
+        if self._attr_current_operation == OPERATION_MODE_HEAT:
             if self._attr_current_temperature < self._attr_target_temperature - 2:
                 if not self._is_heating:
                     self._is_heating = True
-                    self._heating_start_time = time.time()
+                    self._heating_start_time = now
             elif self._attr_current_temperature >= self._attr_target_temperature:
                 if self._is_heating:
                     self._is_heating = False
@@ -276,108 +427,130 @@ class VirtualWaterHeater(WaterHeaterEntity):
             self._is_heating = False
             self._heating_start_time = None
 
-        if was_heating != self._is_heating:
-            self._update_power_consumption()
+        return was_heating != self._is_heating
 
     def _update_power_consumption(self) -> None:
         """Update power consumption based on heating state and heater type."""
         if self._is_heating:
-            power_map: dict[str, tuple[float, float]] = {
-                "electric": (2000, 3000),
-                "gas": (3000, 5000),
-                "solar": (1000, 2000),
-                "heat_pump": (800, 1500),
-                "tankless": (5000, 8000),
-            }
-            min_power, max_power = power_map.get(self._heater_type, (2000, 3000))
-            self._power_consumption = round(random.uniform(min_power, max_power), 0)
+            self._power_consumption = self._nominal_power
         else:
-            standby_map: dict[str, tuple[float, float]] = {
-                "electric": (5, 15),
-                "gas": (10, 30),
-                "solar": (2, 5),
-                "heat_pump": (5, 20),
-                "tankless": (5, 10),
-            }
-            min_power, max_power = standby_map.get(self._heater_type, (5, 15))
-            self._power_consumption = round(random.uniform(min_power, max_power), 0)
+            self._power_consumption = self._nominal_standby
 
     async def async_update(self) -> None:
         """Update water heater state."""
-        current_time = time.time()
-
-        # Simulate temperature change
-        if self._is_heating and self._attr_current_operation == "heat":
-            if self._heating_start_time:
-                elapsed = current_time - self._heating_start_time
-                heating_rate_map: dict[str, float] = {
-                    "electric": 0.5,
-                    "gas": 1.2,
-                    "solar": 0.3,
-                    "heat_pump": 0.4,
-                    "tankless": 2.0,
-                }
-                heating_rate = heating_rate_map.get(self._heater_type, 0.5)
-                temp_increase = (heating_rate * elapsed / 60) * self._efficiency
-                self._attr_current_temperature = min(
-                    self._attr_target_temperature,
-                    self._attr_current_temperature + temp_increase
-                )
-        else:
+        await self.async_advance(time.monotonic())
+
+    async def async_advance(self, now: float) -> None:
+        """Advance the simulation to the monotonic time now."""
+        elapsed = now - (self._last_update or now)
+        self._last_update = now
+
+        # Simulate temperature change over the time since the previous tick
+        if self._is_heating and self._attr_current_operation == OPERATION_MODE_HEAT:
+            temp_increase = (self._heating_rate * elapsed / 60) * self._efficiency
+            self._attr_current_temperature = min(
+                self._attr_target_temperature,
+                self._attr_current_temperature + temp_increase
+            )
+        elif self._attr_current_temperature > 20:
             # Natural cooling
-            if self._attr_current_temperature > 20:
-                cooling_rate = 0.1
-                time_diff = current_time - (self._last_update or current_time)
-                self._attr_current_temperature = max(
-                    20,
-                    self._attr_current_temperature - (cooling_rate * time_diff / 60)
-                )
+            cooling_rate = 0.1
+            self._attr_current_temperature = max(
+                20,
+                self._attr_current_temperature - (cooling_rate * elapsed / 60)
+            )
 
         # Update energy consumption
-        self._last_update = current_time
         if self._power_consumption > 0:
-            time_diff = 1.0 / 3600
-            energy_increase = (self._power_consumption / 1000) * time_diff
+            energy_increase = (self._power_consumption / 1000) * (elapsed / 3600)
             self._energy_consumed_today += energy_increase
             self._total_energy_consumed += energy_increase
 
-        self._update_heating_state()
+        if self._update_heating_state(now):
+            self._update_power_consumption()
+
+        if self._is_solar and now - self._solar_boost_checked >= SOLAR_BOOST_REFRESH_INTERVAL:
+            self._solar_boost_available = bool(random.getrandbits(1))
+            self._solar_boost_checked = now
+
         await self.async_save_state()
-        self.async_write_ha_state()
 
-        if self._templates:
-            self._hass.bus.async_fire(
-                f"{DOMAIN}_water_heater_template_update",
-                {
-                    "entity_id": self.entity_id,
-                    "device_id": self._config_entry_id,
-                    "current_temperature": self._attr_current_temperature,
-                    "target_temperature": self._attr_target_temperature,
-                    "operation_mode": self._attr_current_operation,
-                    "is_heating": self._is_heating,
-                    "power_consumption": self._power_consumption,
-                },
+        if self._templates_enabled:
+            # Only notify template listeners when a reported value changed;
+            # the state_changed event already covers every state write.
+            payload = (
+                self._attr_current_temperature,
+                self._attr_target_temperature,
+                self._attr_current_operation,
+                self._is_heating,
+                self._power_consumption,
             )
+            if payload != self._last_template_payload:
+                self._last_template_payload = payload
+                self._hass.bus.async_fire(
+                    TEMPLATE_UPDATE_EVENT,
+                    {
+                        **self._event_base,
+                        "current_temperature": self._attr_current_temperature,
+                        "target_temperature": self._attr_target_temperature,
+                        "operation_mode": self._attr_current_operation,
+                        "is_heating": self._is_heating,
+                        "power_consumption": self._power_consumption,
+                    },
+                )
+
+    def snapshot(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity's written state."""
+        return (
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+            self._attr_current_operation,
+            self._is_heating,
+            self._power_consumption,
+            round(self._energy_consumed_today, 2),
+            round(self._total_energy_consumed, 2),
+            self._solar_boost_available,
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+        """Return additional state attributes.
+
+        The formatted dict is reused until one of the values it is built
+        from changes; heating_duration advances with the simulation tick.
+        """
+        heating_duration: float | None = None
+        if self._heating_start_time is not None:
+            last_tick = self._last_update or self._heating_start_time
+            heating_duration = round(max(0.0, last_tick - self._heating_start_time), 1)
+
+        key = (
+            self._is_heating,
+            self._power_consumption,
+            self._energy_consumed_today,
+            self._total_energy_consumed,
+            heating_duration,
+            self._solar_boost_available,
+        )
+        if key == self._attrs_cache_key and self._attrs_cache is not None:
+            return self._attrs_cache
+
         attrs: dict[str, Any] = {
-            "heater_type": WATER_HEATER_TYPES.get(self._heater_type, self._heater_type),
-            "tank_capacity": f"{self._tank_capacity}L",
-            "efficiency": f"{self._efficiency * 100:.0f}%",
+            **self._const_attrs,
             "is_heating": self._is_heating,
-            "power_consumption": f"{self._power_consumption:.0f}W",
+            "power_consumption": f"{self._power_consumption}W",
             "energy_consumed_today": f"{self._energy_consumed_today:.2f}kWh",
             "total_energy_consumed": f"{self._total_energy_consumed:.2f}kWh",
         }
 
-        if self._heating_start_time:
-            attrs["heating_duration"] = round(time.time() - self._heating_start_time, 1)
+        if heating_duration is not None:
+            attrs["heating_duration"] = heating_duration
 
-        if self._heater_type == "solar":
-            attrs["solar_boost_available"] = random.choice([True, False])
-        elif self._heater_type == "gas":
+        if self._is_solar:
+            attrs["solar_boost_available"] = self._solar_boost_available
+        elif self._is_gas:
             attrs["pilot_light_on"] = self._is_heating
 
+        self._attrs_cache_key = key
+        self._attrs_cache = attrs
         return attrs
@@ -2,18 +2,15 @@
 from __future__ import annotations
 
 import logging
+import math
 import random
+import time
+from bisect import bisect
 from datetime import datetime, timedelta
+from itertools import accumulate
 from typing import Any
 
 from homeassistant.components.weather import (
-    ATTR_FORECAST_CONDITION,
-    ATTR_FORECAST_IS_DAYTIME,
-    ATTR_FORECAST_NATIVE_PRECIPITATION,
-    ATTR_FORECAST_NATIVE_PRESSURE,
-    ATTR_FORECAST_NATIVE_TEMP,
-    ATTR_FORECAST_NATIVE_TEMP_LOW,
-    ATTR_FORECAST_NATIVE_WIND_SPEED,
     Forecast,
     WeatherEntity,
     WeatherEntityFeature,
@@ -28,9 +25,8 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.storage import Store
 
-from .base_entity import STORAGE_VERSION
+from .base_entity import EntryStorage, async_track_entry_updates
 from .const import (
     CONF_ENTITIES,
     CONF_ENTITY_NAME,
@@ -42,7 +38,77 @@ from .types import WeatherEntityConfig, WeatherState
 
 _LOGGER = logging.getLogger(__name__)
 
-WEATHER_CONDITIONS_LIST: list[str] = list(WEATHER_CONDITIONS.keys())
+WEATHER_CONDITIONS_LIST: tuple[str, ...] = tuple(WEATHER_CONDITIONS)
+
+# Bus event fired for template consumers
+TEMPLATE_UPDATE_EVENT = f"{DOMAIN}_weather_template_update"
+
+# How often the weather stations of an entry are advanced together
+UPDATE_INTERVAL = timedelta(minutes=5)
+_UPDATE_INTERVAL_SECONDS = UPDATE_INTERVAL.total_seconds()
+
+# Seconds to wait before writing state changes to storage
+SAVE_DELAY = 60
+
+# Smallest change in (temperature, humidity, pressure, wind speed) that is
+# reported to template listeners; a condition change is always reported
+_TEMPLATE_EVENT_THRESHOLDS: tuple[float, ...] = (0.5, 2, 1.0, 1.0)
+
+# Weighted condition sampling; snow is more likely in winter
+_WINTER_MONTHS = frozenset({12, 1, 2})
+_RANDOM_CONDITIONS: tuple[str, ...] = (
+    "sunny", "partlycloudy", "cloudy", "rainy", "snowy", "fog", "windy",
+)
+_CONDITION_CUM_WEIGHTS: tuple[int, ...] = tuple(accumulate((30, 25, 20, 15, 5, 3, 2)))
+_WINTER_CONDITION_CUM_WEIGHTS: tuple[int, ...] = tuple(accumulate((30, 25, 20, 15, 20, 3, 2)))
+
+# Base temperature and UV index ranges by month (index 0 unused)
+_WINTER_TEMP, _SPRING_TEMP, _SUMMER_TEMP, _AUTUMN_TEMP = (-5, 10), (10, 25), (20, 35), (10, 20)
+_MONTH_TEMP_RANGE: tuple[tuple[float, float], ...] = (
+    _WINTER_TEMP,
+    _WINTER_TEMP, _WINTER_TEMP, _SPRING_TEMP, _SPRING_TEMP, _SPRING_TEMP, _SUMMER_TEMP,
+    _SUMMER_TEMP, _SUMMER_TEMP, _AUTUMN_TEMP, _AUTUMN_TEMP, _AUTUMN_TEMP, _WINTER_TEMP,
+)
+_LOW_UV, _MID_UV, _HIGH_UV = (1, 4), (3, 8), (6, 11)
+_MONTH_UV_RANGE: tuple[tuple[float, float], ...] = (
+    _LOW_UV,
+    _LOW_UV, _LOW_UV, _MID_UV, _MID_UV, _MID_UV, _HIGH_UV,
+    _HIGH_UV, _HIGH_UV, _MID_UV, _MID_UV, _MID_UV, _LOW_UV,
+)
+_UV_CONDITION_FACTOR: dict[str, float] = {"sunny": 1.0, "partlycloudy": 0.7, "cloudy": 0.3}
+
+# Magnus formula coefficients (°C) for the dew point
+_MAGNUS_A = 17.625
+_MAGNUS_B = 243.04
+
+# SplitMix64 constants, used to spread a configured seed across stations
+_MASK64 = (1 << 64) - 1
+_SPLITMIX64_GAMMA = 0x9E3779B97F4A7C15
+
+# Condition groups that drive the generated measurements
+_WET_CONDITIONS = frozenset({"rainy", "pouring", "lightning-rainy"})
+_CLEAR_CONDITIONS = frozenset({"sunny", "partlycloudy"})
+_OVERCAST_CONDITIONS = frozenset({"cloudy", "fog"})
+_HUMID_CONDITIONS = frozenset({"rainy", "pouring", "fog"})
+_SNOW_CONDITIONS = frozenset({"snowy", "snowy-rainy"})
+_WINDY_CONDITIONS = frozenset({"windy", "windy-variant"})
+_STORM_CONDITIONS = frozenset({"lightning", "lightning-rainy", "pouring"})
+_LOW_VISIBILITY_CONDITIONS = frozenset({"rainy", "pouring", "snowy"})
+
+# Current precipitation (mm) ranges; other conditions are dry
+_PRECIPITATION_RANGE: dict[str, tuple[float, float]] = {
+    "pouring": (10, 50), "rainy": (1, 10), "lightning-rainy": (5, 25),
+    "snowy": (0.5, 5), "snowy-rainy": (0.5, 5),
+}
+
+# Pressure (hPa) and forecast precipitation (mm) ranges by condition; no
+# precipitation range means a dry day
+_ConditionProfile = tuple[tuple[float, float], tuple[float, float] | None]
+_DEFAULT_CONDITION_PROFILE: _ConditionProfile = ((1000, 1020), (0, 5))
+_CONDITION_PROFILE: dict[str, _ConditionProfile] = {
+    **dict.fromkeys(_WET_CONDITIONS, ((990, 1010), (1, 20))),
+    **dict.fromkeys(_CLEAR_CONDITIONS, ((1015, 1030), None)),
+}
 
 
 async def async_setup_entry(
@@ -60,6 +126,12 @@ async def async_setup_entry(
     entities: list[VirtualWeather] = []
     entities_config: list[WeatherEntityConfig] = config_entry.data.get(CONF_ENTITIES, [])
 
+    # One storage file and one load for all stations of this entry
+    storage: EntryStorage[WeatherState] = EntryStorage(
+        hass, "virtual_devices_weather", config_entry.entry_id, SAVE_DELAY
+    )
+    await storage.async_load(len(entities_config))
+
     for idx, entity_config in enumerate(entities_config):
         entity = VirtualWeather(
             hass,
@@ -67,21 +139,63 @@ async def async_setup_entry(
             entity_config,
             idx,
             device_info,
+            storage,
         )
         entities.append(entity)
 
     async_add_entities(entities)
 
+    # Seasons and the time of day are simulated on naive local time
+    async_track_entry_updates(hass, config_entry, entities, UPDATE_INTERVAL, datetime.now)
+
+
+def _station_seed(seed: int, index: int) -> int:
+    """Return the seed of station index, as output index of a SplitMix64 stream."""
+    z = (seed + (index + 1) * _SPLITMIX64_GAMMA) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
 
 class VirtualWeather(WeatherEntity):
     """Representation of a virtual weather station.
 
-    This entity implements state persistence using the same pattern as BaseVirtualEntity.
+    State is persisted through the EntryStorage shared by its config entry.
     """
 
-    _attr_should_poll: bool = True
+    # Only VirtualWeather's own bookkeeping is slotted; WeatherEntity has no
+    # __slots__, so the _attr_* values live in the instance dict as before.
+    __slots__ = (
+        "_hass",
+        "_config_entry_id",
+        "_entity_config",
+        "_index",
+        "_templates",
+        "_storage",
+        "_rand",
+        "_current_precipitation",
+        "_last_condition",
+        "_last_daylight",
+        "_extra_attrs",
+        "_next_update",
+        "_last_emitted",
+    )
+
+    # Updates are driven by the per-entry tick in async_setup_entry
+    _attr_should_poll: bool = False
     _attr_entity_registry_enabled_default: bool = True
 
+    # Identical for every virtual weather station
+    _attr_icon: str = "mdi:weather-partly-cloudy"
+    _attr_supported_features: WeatherEntityFeature = (
+        WeatherEntityFeature.FORECAST_DAILY | WeatherEntityFeature.FORECAST_HOURLY
+    )
+    _attr_native_temperature_unit: str = UnitOfTemperature.CELSIUS
+    _attr_native_pressure_unit: str = UnitOfPressure.HPA
+    _attr_native_wind_speed_unit: str = UnitOfSpeed.KILOMETERS_PER_HOUR
+    _attr_native_visibility_unit: str = UnitOfLength.KILOMETERS
+    _attr_native_precipitation_unit: str = UnitOfLength.MILLIMETERS
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -89,6 +203,7 @@ class VirtualWeather(WeatherEntity):
         entity_config: WeatherEntityConfig,
         index: int,
         device_info: DeviceInfo,
+        storage: EntryStorage[WeatherState],
     ) -> None:
         """Initialize the virtual weather station."""
         self._hass = hass
@@ -100,58 +215,60 @@ class VirtualWeather(WeatherEntity):
         self._attr_name = entity_name
         self._attr_unique_id = f"{config_entry_id}_weather_{index}"
         self._attr_device_info = device_info
-        self._attr_icon = "mdi:weather-partly-cloudy"
 
         # Template support
         self._templates: dict[str, Any] = entity_config.get("templates", {})
 
-        # Storage for state persistence
-        self._store: Store[WeatherState] = Store(
-            hass, STORAGE_VERSION, f"virtual_devices_weather_{config_entry_id}_{index}"
-        )
+        # Each station draws from its own generator; a configured seed makes
+        # its simulation reproducible, distinct per station index
+        seed = entity_config.get("random_seed")
+        self._rand = random.Random(None if seed is None else _station_seed(seed, index))
 
-        # Supported features
-        self._attr_supported_features: WeatherEntityFeature = (
-            WeatherEntityFeature.FORECAST_DAILY | WeatherEntityFeature.FORECAST_HOURLY
-        )
-
-        # Unit settings
-        self._attr_native_temperature_unit = UnitOfTemperature.CELSIUS
-        self._attr_native_pressure_unit = UnitOfPressure.HPA
-        self._attr_native_wind_speed_unit = UnitOfSpeed.KILOMETERS_PER_HOUR
-        self._attr_native_visibility_unit = UnitOfLength.KILOMETERS
-        self._attr_native_precipitation_unit = UnitOfLength.MILLIMETERS
+        # Shared with the other stations of this entry; registered on add
+        self._storage = storage
 
         # Initialize weather state
         # NOTE: HA Core `WeatherEntity` uses `_attr_humidity` (NOT `_attr_native_humidity`)
         # and exposes precipitation only via `extra_state_attributes` (there is no
         # `_attr_native_precipitation`/`_attr_precipitation` field on WeatherEntity).
-        self._attr_condition: str = self._get_random_condition()
-        self._attr_native_temperature: float = self._generate_temperature()
+        now = datetime.now()
+        self._attr_condition: str = self._get_random_condition(now.month)
+        self._attr_native_temperature: float = self._generate_temperature(now.hour, now.month)
         self._attr_humidity: int = self._generate_humidity()
         self._attr_native_pressure: float = self._generate_pressure()
         self._attr_native_wind_speed: float = self._generate_wind_speed()
-        self._attr_wind_bearing: int = random.randint(0, 360)
+        self._attr_wind_bearing: int = self._rand.randint(0, 360)
         self._attr_native_visibility: float = self._generate_visibility()
-        self._attr_uv_index: float = self._generate_uv_index()
+        self._attr_uv_index: float = self._generate_uv_index(now.hour, now.month)
         # HA Core WeatherEntity has no `_attr_native_precipitation` property
         # (only `_attr_native_precipitation_unit`). Track current precipitation
         # as an internal value and expose it via extra_state_attributes.
         self._current_precipitation: float = self._generate_precipitation()
+        # Inputs of the condition-driven values above, to skip redrawing them
+        # while nothing they depend on has changed
+        self._last_condition: str = self._attr_condition
+        self._last_daylight: bool = 6 <= now.hour <= 18
         self._attr_native_apparent_temperature: float = self._generate_apparent_temperature()
         self._attr_native_dew_point: float = self._generate_dew_point()
 
         # Forecast data
-        self._attr_forecast: list[Forecast] = self._generate_forecast()
+        self._attr_forecast: list[Forecast] = self._generate_forecast(now)
 
         # Cloud coverage and ozone
-        self._attr_cloud_coverage: int = random.randint(0, 100)
-        self._attr_ozone: float = random.uniform(100, 400)
+        self._attr_cloud_coverage: int = self._rand.randint(0, 100)
+        self._attr_ozone: float = self._rand.uniform(100, 400)
+
+        # Rolled once per update rather than on every state read
+        self._extra_attrs: dict[str, Any] = {}
+        self._update_extra_attributes()
+
+        # Monotonic time before which async_update leaves the weather alone
+        self._next_update: float = time.monotonic() + _UPDATE_INTERVAL_SECONDS
 
-        # Update time
-        self._last_update: datetime = datetime.now()
+        # Values last sent with a weather.update template event
+        self._last_emitted: tuple[Any, ...] | None = None
 
-        _LOGGER.info(f"Virtual weather '{self._attr_name}' initialized")
+        _LOGGER.info("Virtual weather '%s' initialized", self._attr_name)
 
     def get_default_state(self) -> WeatherState:
         """Return the default state for this entity type."""
@@ -171,6 +288,18 @@ class VirtualWeather(WeatherEntity):
         self._attr_native_pressure = state.get("pressure", 1013.0)
         self._attr_native_wind_speed = state.get("wind_speed", 10.0)
 
+        # Redraw every value derived from the restored readings, so the state
+        # written right after loading is consistent with them
+        now = datetime.now()
+        self._last_condition = self._attr_condition
+        self._last_daylight = 6 <= now.hour <= 18
+        self._attr_native_visibility = self._generate_visibility()
+        self._current_precipitation = self._generate_precipitation()
+        self._attr_uv_index = self._generate_uv_index(now.hour, now.month)
+        self._attr_native_apparent_temperature = self._generate_apparent_temperature()
+        self._attr_native_dew_point = self._generate_dew_point()
+        self._update_extra_attributes()
+
     def get_current_state(self) -> WeatherState:
         """Get current state for persistence."""
         return {
@@ -187,289 +316,288 @@ class VirtualWeather(WeatherEntity):
         return True
 
     async def async_load_state(self) -> None:
-        """Load saved state from storage."""
-        try:
-            data = await self._store.async_load()
-            if data:
-                self.apply_state(data)
-                _LOGGER.debug(f"Weather '{self._attr_name}' state loaded")
-        except Exception as ex:
-            _LOGGER.error(f"Failed to load state for weather '{self._attr_name}': {ex}")
-            self.apply_state(self.get_default_state())
+        """Apply the state loaded for this station by the entry storage."""
+        data = self._storage.get(self._index)
+        if data:
+            self.apply_state(data)
+            _LOGGER.debug("Weather '%s' state loaded", self._attr_name)
 
     async def async_save_state(self) -> None:
-        """Save current state to storage."""
-        try:
-            data = self.get_current_state()
-            await self._store.async_save(data)
-            _LOGGER.debug(f"Weather '{self._attr_name}' state saved")
-        except Exception as ex:
-            _LOGGER.error(f"Failed to save state for weather '{self._attr_name}': {ex}")
+        """Schedule a debounced save of the current state to storage."""
+        if self._storage.async_schedule_save(self._index, self.get_current_state()):
+            _LOGGER.debug("Weather '%s' state save scheduled", self._attr_name)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added to hass."""
         await super().async_added_to_hass()
         await self.async_load_state()
+        self._storage.register(self._index, self.get_current_state)
         self.async_write_ha_state()
-        _LOGGER.info(f"Virtual weather '{self._attr_name}' added to Home Assistant")
+        _LOGGER.info("Virtual weather '%s' added to Home Assistant", self._attr_name)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Write this station's pending state before it is removed."""
+        await super().async_will_remove_from_hass()
+        await self._storage.async_unregister(self._index)
 
     def fire_template_event(self, action: str, **kwargs: Any) -> None:
         """Fire a template update event if templates are configured."""
-        if self._templates:
-            self._hass.bus.async_fire(
-                f"{DOMAIN}_weather_template_update",
-                {
-                    "entity_id": self.entity_id,
-                    "device_id": self._config_entry_id,
-                    "action": action,
-                    **kwargs,
-                },
-            )
+        if not self._templates:
+            return
+        self._hass.bus.async_fire(
+            TEMPLATE_UPDATE_EVENT,
+            {
+                "entity_id": self.entity_id,
+                "device_id": self._config_entry_id,
+                "action": action,
+                **kwargs,
+            },
+        )
 
-    def _get_random_condition(self) -> str:
+    def _get_random_condition(self, month: int) -> str:
         """Get random weather condition based on probability."""
-        conditions: list[tuple[str, int]] = [
-            ("sunny", 30), ("partlycloudy", 25), ("cloudy", 20),
-            ("rainy", 15), ("snowy", 5), ("fog", 3), ("windy", 2),
-        ]
-
-        month = datetime.now().month
-        if month in [12, 1, 2]:
-            conditions.append(("snowy", 15))
-
-        total_weight = sum(weight for _, weight in conditions)
-        rand = random.uniform(0, total_weight)
-        current = 0
-
-        for condition, weight in conditions:
-            current += weight
-            if rand <= current:
-                return condition
-
-        return "sunny"
+        cum_weights = (
+            _WINTER_CONDITION_CUM_WEIGHTS if month in _WINTER_MONTHS else _CONDITION_CUM_WEIGHTS
+        )
+        return _RANDOM_CONDITIONS[bisect(cum_weights, self._rand.random() * cum_weights[-1])]
 
-    def _generate_temperature(self) -> float:
+    def _generate_temperature(self, hour: int, month: int) -> float:
         """Generate realistic temperature based on current time and season."""
-        now = datetime.now()
-        hour = now.hour
-        month = now.month
-
-        if month in [12, 1, 2]:
-            base_temp = random.uniform(-5, 10)
-        elif month in [3, 4, 5]:
-            base_temp = random.uniform(10, 25)
-        elif month in [6, 7, 8]:
-            base_temp = random.uniform(20, 35)
-        else:
-            base_temp = random.uniform(10, 20)
+        base_temp = self._rand.uniform(*_MONTH_TEMP_RANGE[month])
 
         hour_factor = 1 + 0.3 * abs(hour - 12) / 12 if 6 <= hour <= 18 else 0.7
-        temperature = base_temp * hour_factor + random.uniform(-3, 3)
+        temperature = base_temp * hour_factor + self._rand.uniform(-3, 3)
         return round(temperature, 1)
 
     def _generate_apparent_temperature(self) -> float:
         """Generate apparent temperature."""
         apparent_temp = self._attr_native_temperature
         if self._attr_humidity > 70:
-            apparent_temp += random.uniform(1, 3)
+            apparent_temp += self._rand.uniform(1, 3)
         if self._attr_native_wind_speed > 20:
-            apparent_temp -= random.uniform(2, 5)
+            apparent_temp -= self._rand.uniform(2, 5)
         return round(apparent_temp, 1)
 
     def _generate_pressure(self) -> float:
         """Generate realistic atmospheric pressure."""
-        if self._attr_condition in ["rainy", "pouring", "lightning-rainy"]:
-            pressure = random.uniform(990, 1010)
-        elif self._attr_condition in ["sunny", "partlycloudy"]:
-            pressure = random.uniform(1015, 1030)
-        else:
-            pressure = random.uniform(1000, 1020)
-        return round(pressure, 1)
+        pressure_range, _ = _CONDITION_PROFILE.get(
+            self._attr_condition, _DEFAULT_CONDITION_PROFILE
+        )
+        return round(self._rand.uniform(*pressure_range), 1)
 
     def _generate_humidity(self) -> int:
         """Generate realistic humidity."""
-        if self._attr_condition in ["rainy", "pouring", "fog"]:
-            return random.randint(70, 95)
-        elif self._attr_condition in ["sunny", "partlycloudy"]:
-            return random.randint(30, 60)
-        elif self._attr_condition in ["snowy", "snowy-rainy"]:
-            return random.randint(60, 80)
-        return random.randint(40, 70)
+        if self._attr_condition in _HUMID_CONDITIONS:
+            return self._rand.randint(70, 95)
+        elif self._attr_condition in _CLEAR_CONDITIONS:
+            return self._rand.randint(30, 60)
+        elif self._attr_condition in _SNOW_CONDITIONS:
+            return self._rand.randint(60, 80)
+        return self._rand.randint(40, 70)
 
     def _generate_wind_speed(self) -> float:
         """Generate realistic wind speed."""
-        if self._attr_condition in ["windy", "windy-variant"]:
-            wind_speed = random.uniform(20, 50)
-        elif self._attr_condition in ["lightning", "lightning-rainy", "pouring"]:
-            wind_speed = random.uniform(15, 35)
-        elif self._attr_condition in ["sunny"]:
-            wind_speed = random.uniform(0, 15)
+        if self._attr_condition in _WINDY_CONDITIONS:
+            wind_speed = self._rand.uniform(20, 50)
+        elif self._attr_condition in _STORM_CONDITIONS:
+            wind_speed = self._rand.uniform(15, 35)
+        elif self._attr_condition == "sunny":
+            wind_speed = self._rand.uniform(0, 15)
         else:
-            wind_speed = random.uniform(5, 25)
+            wind_speed = self._rand.uniform(5, 25)
         return round(wind_speed, 1)
 
     def _generate_visibility(self) -> float:
         """Generate realistic visibility."""
         if self._attr_condition == "fog":
-            return round(random.uniform(0.1, 1), 1)
-        elif self._attr_condition in ["rainy", "pouring", "snowy"]:
-            return round(random.uniform(1, 10), 1)
+            return round(self._rand.uniform(0.1, 1), 1)
+        elif self._attr_condition in _LOW_VISIBILITY_CONDITIONS:
+            return round(self._rand.uniform(1, 10), 1)
         elif self._attr_condition == "sunny":
-            return round(random.uniform(10, 20), 1)
-        return round(random.uniform(5, 15), 1)
+            return round(self._rand.uniform(10, 20), 1)
+        return round(self._rand.uniform(5, 15), 1)
 
     def _generate_dew_point(self) -> float:
-        """Generate dew point temperature."""
+        """Generate dew point temperature using the Magnus approximation."""
         temp = self._attr_native_temperature
-        humidity = self._attr_humidity
-        dew_point = temp - ((100 - humidity) / 5)
-        return round(dew_point, 1)
+        alpha = math.log(max(self._attr_humidity, 1) / 100) + _MAGNUS_A * temp / (_MAGNUS_B + temp)
+        return round(_MAGNUS_B * alpha / (_MAGNUS_A - alpha), 1)
 
-    def _generate_uv_index(self) -> float:
+    def _generate_uv_index(self, hour: int, month: int) -> float:
         """Generate UV index based on condition and time."""
-        now = datetime.now()
-        hour = now.hour
-        month = now.month
-
         if hour < 6 or hour > 18:
             return 0
 
-        uv_factor = {"sunny": 1.0, "partlycloudy": 0.7, "cloudy": 0.3}.get(self._attr_condition, 0.1)
-
-        if month in [6, 7, 8]:
-            base_uv = random.uniform(6, 11)
-        elif month in [3, 4, 5, 9, 10, 11]:
-            base_uv = random.uniform(3, 8)
-        else:
-            base_uv = random.uniform(1, 4)
-
+        uv_factor = _UV_CONDITION_FACTOR.get(self._attr_condition, 0.1)
+        base_uv = self._rand.uniform(*_MONTH_UV_RANGE[month])
         return round(base_uv * uv_factor, 1)
 
     def _generate_precipitation(self) -> float:
         """Generate precipitation based on weather condition."""
-        precip_map: dict[str, tuple[float, float]] = {
-            "pouring": (10, 50), "rainy": (1, 10), "lightning-rainy": (5, 25),
-            "snowy": (0.5, 5), "snowy-rainy": (0.5, 5),
-        }
-        if self._attr_condition in precip_map:
-            min_val, max_val = precip_map[self._attr_condition]
-            return round(random.uniform(min_val, max_val), 1)
-        return 0
+        precip_range = _PRECIPITATION_RANGE.get(self._attr_condition)
+        if precip_range is None:
+            return 0
+        return round(self._rand.uniform(*precip_range), 1)
 
-    def _generate_forecast(self) -> list[Forecast]:
-        """Generate weather forecast for next 5 days."""
+    def _generate_forecast(self, base_date: datetime) -> list[Forecast]:
+        """Generate weather forecast for the 5 days after base_date."""
         forecast: list[Forecast] = []
-        base_date = datetime.now()
+        # Every day shares the base time of day, and the loop draws ~7 values
+        # per day, so bind the sampler and the per-call constants once
+        uniform = self._rand.uniform
+        base_temp = self._attr_native_temperature
+        is_daytime = 8 <= base_date.hour <= 18
 
         for i in range(5):
             forecast_date = base_date + timedelta(days=i + 1)
-            condition = self._get_random_condition()
-
-            temp_change = random.uniform(-5, 5)
-            high_temp = max(self._attr_native_temperature + temp_change + random.uniform(3, 8), -20)
-            low_temp = high_temp - random.uniform(5, 15)
-
-            if condition in ["rainy", "pouring", "lightning-rainy"]:
-                precipitation = random.uniform(1, 20)
-                pressure = random.uniform(990, 1010)
-            elif condition in ["sunny", "partlycloudy"]:
-                precipitation = 0
-                pressure = random.uniform(1015, 1030)
-            else:
-                precipitation = random.uniform(0, 5)
-                pressure = random.uniform(1000, 1020)
-
-            forecast_data: dict[str, Any] = {
-                "datetime": forecast_date.isoformat(),
+            condition = self._get_random_condition(forecast_date.month)
+
+            temp_change = uniform(-5, 5)
+            high_temp = max(base_temp + temp_change + uniform(3, 8), -20)
+            low_temp = high_temp - uniform(5, 15)
+
+            pressure_range, precip_range = _CONDITION_PROFILE.get(
+                condition, _DEFAULT_CONDITION_PROFILE
+            )
+            precipitation = uniform(*precip_range) if precip_range else 0
+            pressure = uniform(*pressure_range)
+
+            # Forecast is a TypedDict, so a literal builds it without a call
+            day: Forecast = {
                 "condition": condition,
-                ATTR_FORECAST_NATIVE_TEMP: round(high_temp, 1),
-                ATTR_FORECAST_NATIVE_TEMP_LOW: round(low_temp, 1),
-                ATTR_FORECAST_NATIVE_PRECIPITATION: round(precipitation, 1),
-                ATTR_FORECAST_NATIVE_PRESSURE: round(pressure, 1),
-                ATTR_FORECAST_NATIVE_WIND_SPEED: round(random.uniform(5, 30), 1),
-                ATTR_FORECAST_IS_DAYTIME: 8 <= forecast_date.hour <= 18,
+                "datetime": forecast_date.isoformat(),
+                "native_temperature": round(high_temp, 1),
+                "native_templow": round(low_temp, 1),
+                "native_precipitation": round(precipitation, 1),
+                "native_pressure": round(pressure, 1),
+                "native_wind_speed": round(uniform(5, 30), 1),
+                "is_daytime": is_daytime,
             }
-
-            forecast.append(Forecast(forecast_data))
+            forecast.append(day)
 
         return forecast
 
     async def async_update(self) -> None:
         """Update weather data."""
-        if datetime.now() - self._last_update < timedelta(minutes=5):
+        if time.monotonic() < self._next_update:
             return
+        await self.async_advance(datetime.now())
 
-        if random.random() < 0.3:
-            self._attr_condition = self._get_random_condition()
+    async def async_advance(self, now: datetime) -> None:
+        """Advance the simulated weather to the local time now."""
+        hour, month = now.hour, now.month
+        if self._rand.random() < 0.3:
+            self._attr_condition = self._get_random_condition(month)
 
-        self._attr_native_temperature = self._generate_temperature()
+        self._attr_native_temperature = self._generate_temperature(hour, month)
         self._attr_native_apparent_temperature = self._generate_apparent_temperature()
 
-        self._attr_native_pressure += random.uniform(-2, 2)
-        self._attr_native_pressure = round(self._attr_native_pressure, 1)
-
-        self._attr_humidity += random.randint(-5, 5)
-        self._attr_humidity = max(20, min(100, self._attr_humidity))
+        # Random walks, each written back once
+        self._attr_native_pressure = round(
+            self._attr_native_pressure + self._rand.uniform(-2, 2), 1
+        )
+        self._attr_humidity = max(20, min(100, self._attr_humidity + self._rand.randint(-5, 5)))
+        self._attr_native_dew_point = self._generate_dew_point()
+        self._attr_native_wind_speed = max(
+            0, round(self._attr_native_wind_speed + self._rand.uniform(-2, 2), 1)
+        )
 
-        self._attr_native_wind_speed += random.uniform(-2, 2)
-        self._attr_native_wind_speed = max(0, round(self._attr_native_wind_speed, 1))
+        self._attr_wind_bearing = (self._attr_wind_bearing + self._rand.randint(-30, 30)) % 360
 
-        self._attr_wind_bearing = (self._attr_wind_bearing + random.randint(-30, 30)) % 360
-        self._attr_native_visibility = self._generate_visibility()
-        self._attr_uv_index = self._generate_uv_index()
-        self._current_precipitation = self._generate_precipitation()
+        condition_changed = self._attr_condition != self._last_condition
+        if condition_changed:
+            self._last_condition = self._attr_condition
+            self._attr_native_visibility = self._generate_visibility()
+            self._current_precipitation = self._generate_precipitation()
+        daylight = 6 <= hour <= 18
+        if condition_changed or daylight != self._last_daylight:
+            self._last_daylight = daylight
+            self._attr_uv_index = self._generate_uv_index(hour, month)
 
-        if datetime.now().hour == 0 and datetime.now().minute < 10:
-            self._attr_forecast = self._generate_forecast()
+        if hour == 0 and now.minute < 10:
+            self._attr_forecast = self._generate_forecast(now)
 
-        self._last_update = datetime.now()
+        self._update_extra_attributes()
+        self._next_update = time.monotonic() + _UPDATE_INTERVAL_SECONDS
         await self.async_save_state()
-        self.async_write_ha_state()
 
-        self.fire_template_event(
-            "weather.update",
-            condition=self._attr_condition,
-            temperature=self._attr_native_temperature,
-            humidity=self._attr_humidity,
-            pressure=self._attr_native_pressure,
-            wind_speed=self._attr_native_wind_speed,
+        if self._templates and self._template_values_changed():
+            self.fire_template_event(
+                "weather.update",
+                condition=self._attr_condition,
+                temperature=self._attr_native_temperature,
+                humidity=self._attr_humidity,
+                pressure=self._attr_native_pressure,
+                wind_speed=self._attr_native_wind_speed,
+            )
+
+    def snapshot(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity's written state.
+
+        Every advance redraws the temperature and the air quality index, so a
+        station's snapshot practically always changes and each tick writes it.
+        It is compared anyway because the per-entry tick is shared with
+        platforms whose state often stays the same.
+        """
+        return (
+            self._attr_condition,
+            self._attr_native_temperature,
+            self._attr_native_apparent_temperature,
+            self._attr_native_dew_point,
+            self._attr_humidity,
+            self._attr_native_pressure,
+            self._attr_native_wind_speed,
+            self._attr_wind_bearing,
+            self._attr_native_visibility,
+            self._attr_uv_index,
+            self._extra_attrs,
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs: dict[str, Any] = {
+    def _template_values_changed(self) -> bool:
+        """Return True if the reported weather moved past the event thresholds."""
+        values = (
+            self._attr_condition,
+            self._attr_native_temperature,
+            self._attr_humidity,
+            self._attr_native_pressure,
+            self._attr_native_wind_speed,
+        )
+        last = self._last_emitted
+        if (
+            last is not None
+            and values[0] == last[0]
+            and all(
+                abs(new - old) < threshold
+                for new, old, threshold in zip(values[1:], last[1:], _TEMPLATE_EVENT_THRESHOLDS)
+            )
+        ):
+            return False
+        self._last_emitted = values
+        return True
+
+    def _update_extra_attributes(self) -> None:
+        """Recompute the additional state attributes for the current weather."""
+        if self._attr_condition in _CLEAR_CONDITIONS:
+            air_quality_index = self._rand.randint(20, 80)
+        elif self._attr_condition in _OVERCAST_CONDITIONS:
+            air_quality_index = self._rand.randint(50, 100)
+        else:
+            air_quality_index = self._rand.randint(80, 150)
+
+        self._extra_attrs = {
             "cloud_coverage": self._attr_cloud_coverage,
             "ozone": round(self._attr_ozone, 1),
             "native_precipitation": round(self._current_precipitation, 1),
+            "air_quality_index": air_quality_index,
         }
 
-        if self._attr_condition in ["sunny", "partlycloudy"]:
-            attrs["air_quality_index"] = random.randint(20, 80)
-        elif self._attr_condition in ["cloudy", "fog"]:
-            attrs["air_quality_index"] = random.randint(50, 100)
-        else:
-            attrs["air_quality_index"] = random.randint(80, 150)
-
-        return attrs
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return self._extra_attrs
 
     async def async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast."""
-        if not self._attr_forecast:
-            return []
-
-        forecasts: list[Forecast] = []
-        for day_data in self._attr_forecast[:7]:
-            forecast = Forecast(
-                condition=day_data[ATTR_FORECAST_CONDITION],
-                datetime=day_data.get("datetime"),
-                native_temperature=day_data[ATTR_FORECAST_NATIVE_TEMP],
-                native_templow=day_data[ATTR_FORECAST_NATIVE_TEMP_LOW],
-                native_precipitation=day_data.get(ATTR_FORECAST_NATIVE_PRECIPITATION, 0),
-                native_pressure=day_data.get(ATTR_FORECAST_NATIVE_PRESSURE),
-                native_wind_speed=day_data.get(ATTR_FORECAST_NATIVE_WIND_SPEED),
-                is_daytime=day_data.get(ATTR_FORECAST_IS_DAYTIME, True),
-            )
-            forecasts.append(forecast)
-
-        return forecasts
+        # Stored in its final form and replaced, never mutated, when
+        # regenerated, so the list itself can be handed out
+        return self._attr_forecast
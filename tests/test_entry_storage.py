@@ -0,0 +1,265 @@
+"""Tests for the per-entry storage and tick shared by simulated platforms.
+
+Validates that EntryStorage imports the one-file-per-entity state written by
+earlier versions without losing it, that it writes back the stored state of
+entities that were never added (e.g. disabled ones) unchanged, and that one
+failing entity does not stop the per-entry tick for the others.
+
+base_entity is loaded against minimal stand-ins for the Home Assistant modules
+it imports, with a fake Store that keeps files in memory, so these tests run
+without homeassistant installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import types
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+PACKAGE_DIR = Path(__file__).parent.parent / "custom_components" / "virtual_devices"
+PACKAGE_NAME = "virtual_devices_under_test"
+
+ENTRY_ID = "entry"
+PREFIX = "virtual_devices_water_heater"
+COMBINED_KEY = f"{PREFIX}_{ENTRY_ID}"
+
+
+class FakeStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store."""
+
+    files: dict[str, Any] = {}
+    events: list[tuple[str, str]] = []
+    fail_load: set[str] = set()
+    fail_remove: set[str] = set()
+
+    def __init__(self, hass: Any, version: int, key: str) -> None:
+        self.key = key
+        self.delayed: Any = None
+
+    async def async_load(self) -> Any:
+        if self.key in self.fail_load:
+            raise ValueError("corrupt file")
+        return self.files.get(self.key)
+
+    async def async_save(self, data: Any) -> None:
+        self.events.append(("save", self.key))
+        self.files[self.key] = {k: dict(v) for k, v in data.items()}
+
+    async def async_remove(self) -> None:
+        if self.key in self.fail_remove:
+            raise PermissionError("read-only file")
+        self.events.append(("remove", self.key))
+        self.files.pop(self.key, None)
+
+    def async_delay_save(self, data_func: Any, delay: float) -> None:
+        self.delayed = data_func
+
+
+def _module(name: str, **attrs: Any) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+@pytest.fixture
+def base_entity(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Import base_entity with fake Home Assistant modules and a fresh FakeStore."""
+    fakes = [
+        _module("homeassistant"),
+        _module("homeassistant.const", EntityCategory=Enum("EntityCategory", "CONFIG DIAGNOSTIC")),
+        _module("homeassistant.config_entries", ConfigEntry=object),
+        _module("homeassistant.core", HomeAssistant=object, callback=lambda func: func),
+        _module("homeassistant.helpers"),
+        _module("homeassistant.helpers.device_registry", DeviceInfo=dict),
+        _module("homeassistant.helpers.entity", Entity=type("Entity", (), {})),
+        _module(
+            "homeassistant.helpers.event",
+            async_track_time_interval=lambda hass, action, interval: action,
+        ),
+        _module("homeassistant.helpers.storage", Store=FakeStore),
+    ]
+    package = _module(PACKAGE_NAME, __path__=[str(PACKAGE_DIR)])
+    for module in (*fakes, package):
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+    for name in ("const", "types", "base_entity"):
+        monkeypatch.delitem(sys.modules, f"{PACKAGE_NAME}.{name}", raising=False)
+
+    monkeypatch.setattr(FakeStore, "files", {})
+    monkeypatch.setattr(FakeStore, "events", [])
+    monkeypatch.setattr(FakeStore, "fail_load", set())
+    monkeypatch.setattr(FakeStore, "fail_remove", set())
+    return importlib.import_module(f"{PACKAGE_NAME}.base_entity")
+
+
+def _pack(state: dict[str, Any]) -> dict[str, Any]:
+    return {"op": state["operation_mode"], "tt": state["target_temperature"]}
+
+
+def _unpack(data: dict[str, Any]) -> dict[str, Any]:
+    return {"operation_mode": data["op"], "target_temperature": data["tt"]}
+
+
+def _storage(base_entity: types.ModuleType) -> Any:
+    return base_entity.EntryStorage(None, PREFIX, ENTRY_ID, 60, _pack, _unpack)
+
+
+def _legacy_key(index: int) -> str:
+    return f"{COMBINED_KEY}_{index}"
+
+
+class TestLegacyImport:
+    """State saved one file per entity is moved into the combined file."""
+
+    def test_legacy_files_are_packed_then_removed(self, base_entity: types.ModuleType) -> None:
+        """Legacy state SHALL be packed into the combined file before any removal."""
+        FakeStore.files[_legacy_key(0)] = {"operation_mode": "heat", "target_temperature": 55.0}
+        FakeStore.files[_legacy_key(2)] = {"operation_mode": "eco", "target_temperature": 45.0}
+        storage = _storage(base_entity)
+
+        asyncio.run(storage.async_load(3))
+
+        assert FakeStore.files == {
+            COMBINED_KEY: {
+                "0": {"op": "heat", "tt": 55.0},
+                "2": {"op": "eco", "tt": 45.0},
+            }
+        }
+        assert FakeStore.events[0] == ("save", COMBINED_KEY)
+        assert set(FakeStore.events[1:]) == {
+            ("remove", _legacy_key(0)),
+            ("remove", _legacy_key(2)),
+        }
+        assert storage.get(0) == {"operation_mode": "heat", "target_temperature": 55.0}
+        assert storage.get(1) is None
+
+    def test_failed_remove_keeps_imported_state(self, base_entity: types.ModuleType) -> None:
+        """A legacy file that cannot be removed SHALL NOT discard the imported state."""
+        FakeStore.files[_legacy_key(0)] = {"operation_mode": "heat", "target_temperature": 55.0}
+        FakeStore.fail_remove.add(_legacy_key(0))
+        storage = _storage(base_entity)
+
+        asyncio.run(storage.async_load(1))
+
+        assert storage.get(0) == {"operation_mode": "heat", "target_temperature": 55.0}
+        assert FakeStore.files[COMBINED_KEY] == {"0": {"op": "heat", "tt": 55.0}}
+
+    def test_unreadable_legacy_file_only_affects_its_entity(
+        self, base_entity: types.ModuleType
+    ) -> None:
+        """An unreadable legacy file SHALL NOT drop the state of other entities."""
+        FakeStore.files[_legacy_key(0)] = {"operation_mode": "heat", "target_temperature": 55.0}
+        FakeStore.files[_legacy_key(1)] = {"operation_mode": "eco", "target_temperature": 45.0}
+        FakeStore.fail_load.add(_legacy_key(1))
+        storage = _storage(base_entity)
+
+        asyncio.run(storage.async_load(2))
+
+        assert storage.get(0) == {"operation_mode": "heat", "target_temperature": 55.0}
+        assert storage.get(1) is None
+        assert _legacy_key(1) in FakeStore.files
+        assert ("remove", _legacy_key(0)) in FakeStore.events
+
+
+class TestUnregisteredEntities:
+    """Only entities that were added have their state collected."""
+
+    def test_unregistered_index_is_written_back_unchanged(
+        self, base_entity: types.ModuleType
+    ) -> None:
+        """The stored state of an entity that was never added SHALL be kept as is."""
+        FakeStore.files[COMBINED_KEY] = {
+            "0": {"op": "heat", "tt": 55.0},
+            "1": {"op": "eco", "tt": 45.0},
+        }
+        storage = _storage(base_entity)
+        asyncio.run(storage.async_load(2))
+
+        current = {"operation_mode": "off", "target_temperature": 50.0}
+        storage.register(0, lambda: current)
+        assert storage.async_schedule_save(0, current)
+        asyncio.run(storage.async_flush())
+
+        assert FakeStore.files[COMBINED_KEY] == {
+            "0": {"op": "off", "tt": 50.0},
+            "1": {"op": "eco", "tt": 45.0},
+        }
+
+    def test_unchanged_state_schedules_no_save(self, base_entity: types.ModuleType) -> None:
+        """Scheduling a save with the stored state SHALL NOT mark the storage dirty."""
+        FakeStore.files[COMBINED_KEY] = {"0": {"op": "heat", "tt": 55.0}}
+        storage = _storage(base_entity)
+        asyncio.run(storage.async_load(1))
+
+        assert not storage.async_schedule_save(
+            0, {"operation_mode": "heat", "target_temperature": 55.0}
+        )
+        asyncio.run(storage.async_flush())
+
+        assert FakeStore.events == []
+
+
+class FakeEntry:
+    """Config entry that keeps its unload callbacks."""
+
+    def __init__(self) -> None:
+        self.on_unload: list[Any] = []
+
+    def async_on_unload(self, func: Any) -> None:
+        self.on_unload.append(func)
+
+
+class FakeEntity:
+    """Simulated entity whose state is a counter."""
+
+    def __init__(self, entity_id: str, fail: bool = False) -> None:
+        self.hass: Any = object()
+        self.entity_id = entity_id
+        self.fail = fail
+        self.value = 0
+        self.writes = 0
+
+    def snapshot(self) -> tuple[Any, ...]:
+        return (self.value,)
+
+    async def async_advance(self, now: Any) -> None:
+        if self.fail:
+            raise RuntimeError("broken simulation")
+        self.value += 1
+
+    def async_write_ha_state(self) -> None:
+        self.writes += 1
+
+
+class TestEntryUpdates:
+    """All entities of an entry are advanced from one tick."""
+
+    def test_failing_entity_does_not_stop_the_others(
+        self, base_entity: types.ModuleType
+    ) -> None:
+        """An entity that raises SHALL NOT keep later entities from updating."""
+        entities = [FakeEntity("weather.a", fail=True), FakeEntity("weather.b")]
+        entry = FakeEntry()
+        base_entity.async_track_entry_updates(None, entry, entities, None, lambda: 0)
+
+        asyncio.run(entry.on_unload[0](None))
+
+        assert entities[0].writes == 0
+        assert entities[1].writes == 1
+
+    def test_entities_not_added_are_skipped(self, base_entity: types.ModuleType) -> None:
+        """An entity without hass SHALL be neither advanced nor written."""
+        entities = [FakeEntity("weather.a")]
+        entities[0].hass = None
+        entry = FakeEntry()
+        base_entity.async_track_entry_updates(None, entry, entities, None, lambda: 0)
+
+        asyncio.run(entry.on_unload[0](None))
+
+        assert entities[0].value == 0
+        assert entities[0].writes == 0